@@ -1,23 +1,82 @@
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.background import BackgroundTask
+import asyncio
+import hashlib
 import os
-import requests
-from datetime import datetime, timedelta
+import sys
+import tempfile
+import time
+import httpx
+import orjson
+import redis.asyncio as aioredis
+from jinja2 import FileSystemBytecodeCache
+from lru import LRU
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional
+from urllib.parse import urlencode
 
-app = FastAPI(title="Public Gallery")
+app = FastAPI(title="Public Gallery", default_response_class=ORJSONResponse)
 BASE = os.getenv("BACKEND_BASE", "http://localhost:9000").rstrip("/")
 API_KEY = os.getenv("API_KEY", "")
 templates = Jinja2Templates(directory="app/templates")
+
+# Compiled templates: kept in memory, persisted as bytecode across restarts, and
+# not re-checked on disk unless TEMPLATE_AUTO_RELOAD=1 (for development)
+JINJA_CACHE_DIR = os.getenv("JINJA_CACHE_DIR", os.path.join(tempfile.gettempdir(), "jinja_cache"))
+os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+templates.env.bytecode_cache = FileSystemBytecodeCache(JINJA_CACHE_DIR)
+templates.env.auto_reload = os.getenv("TEMPLATE_AUTO_RELOAD", "0") == "1"
 app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
-# Simple in-memory cache to reduce backend calls
-_cache: dict = {}
-_cache_time: dict = {}
+# Bounded in-memory LRU cache to reduce backend calls:
+# key -> (expires_at_ns, data, etag, last_modified); expired entries are revalidated
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "256"))
+_cache = LRU(CACHE_MAX_ENTRIES)
+_cache_bytes: dict = {}  # endpoint -> (source data, encoded JSON response)
+_inflight: dict = {}  # key -> task of the backend fetch in progress
 CACHE_TTL = int(os.getenv("CACHE_TTL", "300"))  # seconds
+CACHE_TTL_NS = CACHE_TTL * 1_000_000_000  # cache expiry is compared against time.monotonic_ns()
+MEDIUMS_CACHE_KEY = "__mediums__"
+# Optional Redis cache shared by all workers, checked after the in-process cache
+REDIS_URL = os.getenv("REDIS_URL", "")
+REDIS_PREFIX = "gallery:"
+# Bumped on every cache clear; workers poll it and drop their in-process caches
+# when it changes. Kept outside REDIS_PREFIX so clearing never deletes it.
+REDIS_GENERATION_KEY = "gallery-generation"
+GENERATION_POLL_NS = 1_000_000_000
+_generation: Optional[bytes] = None
+_generation_checked_ns = 0
+# Forward gallery filters to the backend's /api/artworks when it supports them
+BACKEND_FILTERING = os.getenv("BACKEND_FILTERING", "0") == "1"
+
+# Browser and CDN caching for the rendered gallery pages; page ETags also cover
+# the template sources so a deploy with changed markup invalidates them
+PAGE_CACHE_CONTROL = "public, max-age=60, s-maxage=300"
+TEMPLATES_DIGEST = hashlib.blake2b(
+    b"".join(templates.env.loader.get_source(templates.env, n)[0].encode() for n in templates.env.list_templates())
+).digest()
+
+# Fallback media proxy for deployments without a reverse proxy in front;
+# set MEDIA_PROXY=0 when nginx serves /media/ straight from the backend
+MEDIA_PROXY = os.getenv("MEDIA_PROXY", "1") == "1"
+# Media proxy: large chunks keep per-chunk overhead low for big images
+MEDIA_CHUNK_SIZE = 1024 * 1024
+# Browser validators forwarded to the backend, and backend headers passed back
+MEDIA_REQUEST_HEADERS = ("If-None-Match", "If-Modified-Since")
+MEDIA_RESPONSE_HEADERS = ("Content-Length", "Content-Encoding", "ETag", "Last-Modified")
+
+# Shared async HTTP client (keep-alive connection pool), created on startup
+client: Optional[httpx.AsyncClient] = None
+# Separate pool for the media proxy: a streamed image holds its connection until
+# the browser has the whole body, so it must not compete with API fetches
+media_client: Optional[httpx.AsyncClient] = None
+redis_client: Optional[aioredis.Redis] = None
 
 app.add_middleware(
     CORSMiddleware,
@@ -28,31 +87,327 @@ app.add_middleware(
 )
 
 
-def _get(path: str):
+@app.on_event("startup")
+async def startup():
+    """Open the backend clients and Redis pool, and pre-compile templates."""
+    global client, media_client, redis_client
+    client = httpx.AsyncClient(
+        base_url=BASE,
+        headers={"X-API-Key": API_KEY} if API_KEY else {},
+        timeout=20,
+        follow_redirects=True,  # like requests.get did
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    )
+    media_client = httpx.AsyncClient(
+        base_url=BASE,
+        headers={"X-API-Key": API_KEY} if API_KEY else {},
+        timeout=30,
+        follow_redirects=True,
+        limits=httpx.Limits(max_keepalive_connections=16, max_connections=64),
+    )
+    if REDIS_URL:
+        redis_client = aioredis.from_url(REDIS_URL)
+
+    # Compile every template now so the first request doesn't pay for it
+    for name in templates.env.list_templates():
+        templates.env.get_template(name)
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Close the backend clients and the Redis connection pool."""
+    if client is not None:
+        await client.aclose()
+    if media_client is not None:
+        await media_client.aclose()
+    if redis_client is not None:
+        await redis_client.aclose()
+
+
+async def _get(path: str, params: Optional[dict] = None):
     """
     Fetch data from backend API with caching.
     Returns cached data if still valid, otherwise fetches fresh data.
+    Query params are forwarded to the backend and are part of the cache key.
     """
+    key = f"{path}?{urlencode(sorted(params.items()))}" if params else path
+    await _sync_generation()
+
     # Return cached value if fresh
-    last = _cache_time.get(path)
-    if path in _cache and last and (datetime.now() - last) < timedelta(seconds=CACHE_TTL):
-        return _cache[path]
+    entry = _fresh(key)
+    if entry:
+        return entry[1]
+
+    # Join the fetch already in flight for this key, if any, so a burst of misses
+    # makes one backend call and every waiter gets its result or its error
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch(key, path, params))
+        _inflight[key] = task
+        task.add_done_callback(lambda t: _fetch_done(key, t))
+    # A cancelled (disconnected) caller must not cancel the shared fetch
+    return await asyncio.shield(task)
+
+
+def _fetch_done(key: str, task: asyncio.Task):
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    if not task.cancelled():
+        task.exception()  # mark retrieved even if every waiter went away
+
+
+def _fresh(key: str):
+    """Return the cache entry for key if it has not expired."""
+    entry = _cache.get(key)
+    if entry and entry[0] > time.monotonic_ns():
+        return entry
+    return None
+
+
+async def _fetch(key: str, path: str, params: Optional[dict] = None):
+    # Another worker may already have fetched it into the shared cache
+    shared = await _redis_get(key)
+    if shared is not None:
+        body, etag, last_modified, ttl_ns = shared
+        data = _decode(path, body)
+        # Expire with the shared copy so data is never older than CACHE_TTL
+        _cache[key] = (time.monotonic_ns() + min(ttl_ns, CACHE_TTL_NS), data, etag, last_modified)
+        return data
+
+    # Revalidate an expired entry so an unchanged resource costs a 304, not a re-parse
+    stale = _cache.get(key)
+    headers = {}
+    if stale and stale[2]:
+        headers["If-None-Match"] = stale[2]
+    if stale and stale[3]:
+        headers["If-Modified-Since"] = stale[3]
 
-    headers = {"X-API-Key": API_KEY} if API_KEY else {}
     try:
-        r = requests.get(f"{BASE}{path}", headers=headers, timeout=20)
-        if not r.ok:
+        r = await client.get(path, params=params, headers=headers)
+        if r.status_code == 304 and stale:
+            _cache[key] = (time.monotonic_ns() + CACHE_TTL_NS, stale[1], stale[2], stale[3])
+            await _redis_set(key, orjson.dumps(stale[1]), stale[2], stale[3])
+            return stale[1]
+        if not r.is_success:
             raise HTTPException(status_code=r.status_code, detail=r.text)
 
-        data = r.json()
-        _cache[path] = data
-        _cache_time[path] = datetime.now()
+        data = _decode(path, r.content)
+        etag, last_modified = r.headers.get("ETag"), r.headers.get("Last-Modified")
+        _cache[key] = (time.monotonic_ns() + CACHE_TTL_NS, data, etag, last_modified)
+        await _redis_set(key, r.content, etag, last_modified)
         return data
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         # Handle network errors gracefully
         raise HTTPException(status_code=503, detail=f"Backend service unavailable: {str(e)}")
 
 
+def _decode(path: str, body: bytes):
+    data = orjson.loads(body)
+    if path == "/api/artworks" and isinstance(data, list):
+        data = _Artworks(data)
+    return data
+
+
+async def _redis_get(key: str) -> Optional[tuple]:
+    """
+    Read (body, etag, last_modified, ttl_ns) from Redis; Redis errors count as a miss.
+    The validators travel with the body so any worker can revalidate the entry,
+    and ttl_ns is how long the shared copy has left.
+    """
+    if redis_client is None:
+        return None
+    name = REDIS_PREFIX + key
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            fields, pttl = await pipe.hgetall(name).pttl(name).execute()
+    except aioredis.RedisError:
+        return None
+    if b"body" not in fields:
+        return None
+    return (
+        fields[b"body"],
+        fields.get(b"etag", b"").decode() or None,
+        fields.get(b"last_modified", b"").decode() or None,
+        pttl * 1_000_000 if pttl >= 0 else CACHE_TTL_NS,  # -1: no expiry set
+    )
+
+
+async def _redis_set(key: str, body: bytes, etag: Optional[str], last_modified: Optional[str]):
+    """Store a raw response body and its validators in Redis for CACHE_TTL; errors are ignored."""
+    if redis_client is None:
+        return
+    name = REDIS_PREFIX + key
+    mapping = {"body": body, "etag": etag or "", "last_modified": last_modified or ""}
+    try:
+        async with redis_client.pipeline(transaction=True) as pipe:
+            await pipe.delete(name).hset(name, mapping=mapping).expire(name, CACHE_TTL).execute()
+    except aioredis.RedisError:
+        pass
+
+
+async def _redis_clear() -> bool:
+    """
+    Delete every gallery key from Redis and bump the generation so the other
+    workers drop their in-process caches. Returns False without a reachable Redis.
+    """
+    global _generation
+    if redis_client is None:
+        return False
+    try:
+        keys = [k async for k in redis_client.scan_iter(match=REDIS_PREFIX + "*")]
+        if keys:
+            await redis_client.delete(*keys)
+        _generation = str(await redis_client.incr(REDIS_GENERATION_KEY)).encode()
+    except aioredis.RedisError:
+        return False
+    return True
+
+
+async def _sync_generation():
+    """
+    Drop this worker's in-process caches if another worker cleared the cache.
+    Redis is asked at most once per GENERATION_POLL_NS, not on every hit.
+    """
+    global _generation, _generation_checked_ns
+    if redis_client is None:
+        return
+    now = time.monotonic_ns()
+    if now - _generation_checked_ns < GENERATION_POLL_NS:
+        return
+    _generation_checked_ns = now
+    try:
+        generation = await redis_client.get(REDIS_GENERATION_KEY)
+    except aioredis.RedisError:
+        return
+    if generation != _generation:
+        _generation = generation
+        _clear_local()
+
+
+def _clear_local():
+    """Empty this worker's in-process caches."""
+    _cache.clear()  # also drops the derived MEDIUMS_CACHE_KEY entry
+    _cache_bytes.clear()
+
+
+class _Artworks(list):
+    """
+    Artwork records plus per-field columns derived once when the list is fetched,
+    so gallery filters compare precomputed values instead of re-deriving them.
+    """
+    __slots__ = ("haystacks", "years", "mediums", "mediums_lower")
+
+    def __init__(self, items=()):
+        super().__init__(items)
+        # Kept as str: `bytes in bytes` goes through the buffer protocol and
+        # benchmarks several times slower than `str in str`
+        self.haystacks = [
+            f"{a.get('artwork_id','')} {a.get('title','')} {a.get('keywords','')} {a.get('medium','')} {a.get('surface','')}".lower()
+            for a in self
+        ]
+        self.years = [_parse_year(a.get('year')) for a in self]
+        self.mediums = [(a.get('medium') or '').strip() for a in self]
+        self.mediums_lower = [m.lower() for m in self.mediums]
+
+
+def _parse_year(year) -> Optional[int]:
+    if not year:
+        return None
+    try:
+        return int(year)
+    except (ValueError, TypeError):
+        return None
+
+
+def _filter_artworks(items: _Artworks, ql: str, year_from_int: Optional[int],
+                     year_to_int: Optional[int], medium_lower: Optional[str]) -> list:
+    """
+    Artworks matching every active filter, in their original order.
+    The first active filter scans its precomputed column zipped with positions;
+    later ones only re-check the survivors. No per-item function calls.
+    """
+    idx = None  # positions passing the filters applied so far
+
+    # Text search across several fields
+    if ql:
+        idx = [i for i, h in enumerate(items.haystacks) if ql in h]
+
+    # Year range filter; artworks without a valid year never match
+    if year_from_int is not None or year_to_int is not None:
+        years = items.years
+        lo = year_from_int if year_from_int is not None else -sys.maxsize
+        hi = year_to_int if year_to_int is not None else sys.maxsize
+        if idx is None:
+            idx = [i for i, y in enumerate(years) if y is not None and lo <= y <= hi]
+        else:
+            idx = [i for i in idx if (y := years[i]) is not None and lo <= y <= hi]
+
+    # Medium filter (case-insensitive exact match)
+    if medium_lower is not None:
+        mediums_lower = items.mediums_lower
+        if idx is None:
+            idx = [i for i, m in enumerate(mediums_lower) if m == medium_lower]
+        else:
+            idx = [i for i in idx if mediums_lower[i] == medium_lower]
+
+    if idx is None:
+        return items
+    return [items[i] for i in idx]
+
+
+def _get_mediums(all_artworks: _Artworks) -> list:
+    """
+    Sorted unique mediums for the gallery dropdown.
+    Mediums change rarely, so the list is cached longer than the artworks.
+    """
+    entry = _fresh(MEDIUMS_CACHE_KEY)
+    if entry:
+        return entry[1]
+
+    mediums = sorted({m for m in all_artworks.mediums if m})
+    _cache[MEDIUMS_CACHE_KEY] = (time.monotonic_ns() + CACHE_TTL_NS * 10, mediums, None, None)
+    return mediums
+
+
+def _etag(data) -> str:
+    """Weak ETag for the backend data a page is rendered from (and the templates)."""
+    h = hashlib.blake2b(TEMPLATES_DIGEST, digest_size=8)
+    h.update(orjson.dumps(data))
+    return f'W/"{h.hexdigest()}"'
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    """True if the client's If-None-Match already names this ETag."""
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    return header.strip() == "*" or etag in (t.strip() for t in header.split(","))
+
+
+def _not_modified_response(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": PAGE_CACHE_CONTROL})
+
+
+@dataclass(slots=True)
+class Pagination:
+    """Pagination state for the gallery listing template."""
+    page: int
+    per_page: int
+    total_items: int
+    total_pages: int
+    has_prev: bool
+    has_next: bool
+
+
+@dataclass(slots=True)
+class Filters:
+    """Active gallery filters, echoed back into the search form."""
+    q: str
+    year_from: str
+    year_to: str
+    medium: str
+
+
 from fastapi.responses import RedirectResponse
 
 @app.get("/")
@@ -62,7 +417,7 @@ def root():
 
 
 @app.get("/gallery")
-def gallery_index(
+async def gallery_index(
     request: Request,
     q: Optional[str] = None,
     year_from: Optional[str] = None,  # accept strings from form inputs
@@ -80,16 +435,9 @@ def gallery_index(
     if page < 1:
         page = 1
 
-    items = _get("/api/artworks") or []
-
-    # Text search across several fields
-    if q:
-        ql = q.lower().strip()
-        if ql:  # Only filter if query is not empty after stripping
-            def matches_query(a):
-                haystack = f"{a.get('artwork_id','')} {a.get('title','')} {a.get('keywords','')} {a.get('medium','')} {a.get('surface','')}".lower()
-                return ql in haystack
-            items = [a for a in items if matches_query(a)]
+    # Normalise the filters once; the same values are sent to the backend and
+    # used for the local filtering below
+    ql = q.lower().strip() if q else ''
 
     # Convert year_from/to (strings) to ints only if provided and valid
     year_from_int = None
@@ -106,41 +454,30 @@ def gallery_index(
         except ValueError:
             year_to_int = None
 
-    # Year filters with safe int conversion
-    if year_from_int is not None:
-        def year_gte(a):
-            year = a.get('year')
-            if not year:
-                return False
-            try:
-                return int(year) >= year_from_int
-            except (ValueError, TypeError):
-                return False
-        items = [a for a in items if year_gte(a)]
-
-    if year_to_int is not None:
-        def year_lte(a):
-            year = a.get('year')
-            if not year:
-                return False
-            try:
-                return int(year) <= year_to_int
-            except (ValueError, TypeError):
-                return False
-        items = [a for a in items if year_lte(a)]
+    medium_lower = medium.lower().strip() if medium else None
 
-    # Medium filter (case-insensitive exact match)
-    if medium:
-        medium_lower = medium.lower().strip()
-        items = [a for a in items if a.get('medium', '').lower() == medium_lower]
+    params = {}
+    if BACKEND_FILTERING:
+        # Let the backend narrow the list; the filters below still apply, so
+        # results are the same whether or not it honours every param
+        params = {
+            k: v for k, v in (('q', ql), ('year_from', year_from_int), ('year_to', year_to_int), ('medium', medium_lower))
+            if v not in (None, '')
+        }
+
+    if params:
+        # The full list is still needed for the mediums dropdown; fetch both at once
+        all_artworks, items = await asyncio.gather(_get("/api/artworks"), _get("/api/artworks", params))
+        all_artworks = all_artworks or _Artworks()
+        items = items or _Artworks()
+    else:
+        all_artworks = await _get("/api/artworks") or _Artworks()
+        items = all_artworks
+
+    items = _filter_artworks(items, ql, year_from_int, year_to_int, medium_lower)
 
     # Get unique mediums for dropdown (from all artworks, not filtered)
-    all_artworks = _get("/api/artworks") or []
-    mediums = sorted({
-        a.get('medium', '').strip() 
-        for a in all_artworks 
-        if a.get('medium', '').strip()
-    })
+    mediums = _get_mediums(all_artworks)
 
     # Pagination
     total_items = len(items)
@@ -153,29 +490,37 @@ def gallery_index(
     end_idx = start_idx + per_page
     paginated_items = items[start_idx:end_idx]
 
-    return templates.TemplateResponse('gallery_list.html', {
+    # Revalidating browsers/CDNs get a 304 without rendering the page
+    etag = _etag([paginated_items, mediums, page, total_items])
+    if _not_modified(request, etag):
+        return _not_modified_response(etag)
+
+    response = templates.TemplateResponse('gallery_list.html', {
         'request': request,
         'artworks': paginated_items,
         'mediums': mediums,
-        'pagination': {
-            'page': page,
-            'per_page': per_page,
-            'total_items': total_items,
-            'total_pages': total_pages,
-            'has_prev': page > 1,
-            'has_next': page < total_pages
-        },
-        'filters': {
-            'q': q or '',
-            'year_from': year_from or '',  # keep original string for form
-            'year_to': year_to or '',      # keep original string for form
-            'medium': medium or ''
-        }
+        'pagination': Pagination(
+            page=page,
+            per_page=per_page,
+            total_items=total_items,
+            total_pages=total_pages,
+            has_prev=page > 1,
+            has_next=page < total_pages
+        ),
+        'filters': Filters(
+            q=q or '',
+            year_from=year_from or '',  # keep original string for form
+            year_to=year_to or '',      # keep original string for form
+            medium=medium or ''
+        )
     })
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = PAGE_CACHE_CONTROL
+    return response
 
 
 @app.get("/gallery/{artwork_id}")
-def gallery_show(artwork_id: str, request: Request):
+async def gallery_show(artwork_id: str, request: Request):
     """
     Individual artwork detail page.
     """
@@ -184,11 +529,7 @@ def gallery_show(artwork_id: str, request: Request):
         raise HTTPException(status_code=400, detail="Invalid artwork ID")
     
     try:
-        artwork = _get(f"/api/artworks/{artwork_id}")
-        return templates.TemplateResponse("gallery_show.html", {
-            "request": request, 
-            "artwork": artwork
-        })
+        artwork = await _get(f"/api/artworks/{artwork_id}")
     except HTTPException as e:
         if e.status_code == 404:
             # Render a friendly 404 page
@@ -199,21 +540,37 @@ def gallery_show(artwork_id: str, request: Request):
             )
         raise
 
+    etag = _etag(artwork)
+    if _not_modified(request, etag):
+        return _not_modified_response(etag)
 
-@app.get("/media/{full_path:path}")
-def media_proxy(full_path: str):
+    response = templates.TemplateResponse("gallery_show.html", {
+        "request": request, 
+        "artwork": artwork
+    })
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = PAGE_CACHE_CONTROL
+    return response
+
+
+async def media_proxy(full_path: str, request: Request):
     """
     Proxy media files from backend to avoid CORS issues.
+    Conditional requests are passed through so repeat views get a 304.
+    Only registered when MEDIA_PROXY is on; normally nginx serves /media/.
     """
     # Basic security: prevent path traversal
     if ".." in full_path or full_path.startswith("/"):
         raise HTTPException(status_code=400, detail="Invalid media path")
     
-    url = f"{BASE}/media/{full_path}"
+    url = f"/media/{full_path}"
+    conditional = {h: request.headers[h] for h in MEDIA_REQUEST_HEADERS if h in request.headers}
     
     try:
-        r = requests.get(url, stream=True, timeout=30)
-        if not r.ok:
+        # Keep the response open past this handler; it is closed once streamed
+        r = await media_client.send(media_client.build_request("GET", url, headers=conditional), stream=True)
+        if r.status_code != 304 and not r.is_success:
+            await r.aclose()
             raise HTTPException(status_code=r.status_code, detail="Media not found")
         
         # Determine content type
@@ -224,46 +581,47 @@ def media_proxy(full_path: str):
             "Content-Type": content_type,
             "Cache-Control": "public, max-age=86400",  # Cache for 24 hours
         }
+        headers.update({h: r.headers[h] for h in MEDIA_RESPONSE_HEADERS if h in r.headers})
         
+        if r.status_code == 304:
+            await r.aclose()
+            headers.pop("Content-Type")
+            return Response(status_code=304, headers=headers)
+        
+        # Raw (undecoded) bytes, so Content-Encoding/Content-Length stay valid
         return StreamingResponse(
-            r.iter_content(chunk_size=64*1024), 
-            headers=headers
+            r.aiter_raw(MEDIA_CHUNK_SIZE), 
+            headers=headers,
+            background=BackgroundTask(r.aclose)
         )
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         raise HTTPException(status_code=503, detail=f"Media service unavailable: {str(e)}")
 
 
+if MEDIA_PROXY:
+    app.add_api_route("/media/{full_path:path}", media_proxy, methods=["GET"])
+
+
 @app.get("/api/stats")
-def stats():
+async def stats():
     """
     Statistics endpoint showing artwork distribution.
+    The encoded JSON is reused until the cached artworks list changes.
     """
-    # keep for backwards compatibility, delegate to helper
-    return _compute_stats()
-
+    items = await _get("/api/artworks") or _Artworks()
+    entry = _cache_bytes.get("/api/stats")
+    if entry is None or entry[0] is not items:
+        entry = (items, orjson.dumps(_compute_stats(items)))
+        _cache_bytes["/api/stats"] = entry
+    return Response(entry[1], media_type="application/json")
 
-def _compute_stats():
-    items = _get("/api/artworks") or []
-    mediums = {}
-    years = {}
 
-    for item in items:
-        medium = item.get('medium')
-        if medium:
-            medium = medium.strip()
-            mediums[medium] = mediums.get(medium, 0) + 1
-        else:
-            mediums['Unknown'] = mediums.get('Unknown', 0) + 1
-
-        year = item.get('year')
-        if year:
-            try:
-                year = str(int(year))
-                years[year] = years.get(year, 0) + 1
-            except (ValueError, TypeError):
-                years['Unknown'] = years.get('Unknown', 0) + 1
-        else:
-            years['Unknown'] = years.get('Unknown', 0) + 1
+def _compute_stats(items: _Artworks):
+    # Count the columns precomputed at fetch time rather than re-parsing each item.
+    # Mediums are stripped, so missing, empty and whitespace-only ones all count
+    # as 'Unknown' (whitespace-only ones used to get their own '' bucket)
+    mediums = Counter(m or 'Unknown' for m in items.mediums)
+    years = Counter(str(y) if y is not None else 'Unknown' for y in items.years)
 
     return {
         "total_artworks": len(items),
@@ -273,11 +631,11 @@ def _compute_stats():
 
 
 @app.get("/stats")
-def stats_page(request: Request):
+async def stats_page(request: Request):
     """
     Statistics page showing artwork distribution.
     """
-    stats_data = _compute_stats()
+    stats_data = _compute_stats(await _get("/api/artworks") or _Artworks())
     return templates.TemplateResponse("stats.html", {
         "request": request,
         "stats": stats_data
@@ -293,13 +651,13 @@ def about_page(request: Request):
 
 
 @app.get("/health")
-def health_check():
+async def health_check():
     """
     Health check endpoint for monitoring.
     """
     try:
         # Test backend connectivity
-        _get("/api/artworks")
+        await _get("/api/artworks")
         return {
             "status": "healthy",
             "backend": "connected",
@@ -317,18 +675,20 @@ def health_check():
 
 # Optional: Add endpoint to clear cache (useful for debugging)
 @app.post("/api/cache/clear")
-def clear_cache(api_key: str):
+async def clear_cache(api_key: str):
     """
     Clear the cache. Requires API key for security.
     """
     if api_key != API_KEY or not API_KEY:
         raise HTTPException(status_code=403, detail="Forbidden")
     
-    _cache.clear()
-    _cache_time.clear()
+    _clear_local()
+    # Without Redis the other workers (WEB_CONCURRENCY > 1) cannot be told, so
+    # only this worker's cache is cleared; the others expire within CACHE_TTL
+    shared_cleared = await _redis_clear()
     
     return {
         "status": "success",
-        "message": "Cache cleared",
+        "message": "Cache cleared" if shared_cleared else "Cache cleared in this worker only (shared Redis cache unavailable)",
         "timestamp": datetime.now().isoformat()
     }
\ No newline at end of file